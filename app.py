@@ -1,31 +1,44 @@
 """Streamlit app for CQE."""
 
+import pandas as pd
 import streamlit as st
 
 import cqe
 
 
 def create_input_label(name, unit) -> str:
-    """Input number."""
+    """Input column label."""
 
-    label = f"# **{name}** ({unit})"
+    label = f"{name} ({unit})"
     return label
 
 
+@st.cache_data
+def create_compost(inputs: tuple):
+    """Create a compost, cached per inputs and copied for every caller."""
+
+    return cqe.Compost(dict(inputs))
+
+
 st.title("Hello World")
 
 st.write("Welcome to my first Streamlit app!")
 
-inputs = {}
-
-for prop in cqe.get_all_property_names():
-    if prop == "Ratio":
-        continue
+columns = [prop for prop in cqe.get_all_property_names() if prop != "Ratio"]
 
-    inputs[prop] = st.number_input(create_input_label(prop, cqe.units[prop]))
+table = st.data_editor(
+    pd.DataFrame([{prop: 0.0 for prop in columns}]),
+    column_config={
+        prop: st.column_config.NumberColumn(create_input_label(prop, cqe.units[prop]))
+        for prop in columns
+    },
+    num_rows="fixed",
+    hide_index=True,
+)
 
 if st.button("Calculate"):
-    compost = cqe.Compost(inputs)
+    inputs = table.iloc[0].to_dict()
+    compost = create_compost(tuple(inputs.items()))
 
     st.write(compost.check_compliance())
     st.write(compost.get_fertility_index())
@@ -0,0 +1,51 @@
+"""Module for the Numba compiled batch kernels of the compost calculations.
+
+Importing this module requires numba; cqe._kernels falls back to NumPy
+when it is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+from cqe.globs import MAX_SCORE
+
+
+@njit(cache=True, parallel=True)
+def batch_index(
+    values: np.ndarray, limits: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Calculate the weighted index of every row of values."""
+
+    index = np.empty(values.shape[0], dtype=np.float64)
+    weight_sum = weights.sum()
+
+    for row in prange(values.shape[0]):  # pylint: disable=not-an-iterable
+        total = 0.0
+        for col in range(values.shape[1]):
+            exceeded = 0
+            for limit in limits[col]:
+                if values[row, col] > limit:
+                    exceeded += 1
+            total += weights[col] * (MAX_SCORE - exceeded)
+        index[row] = total / weight_sum
+
+    return index
+
+
+@njit(cache=True, parallel=True)
+def batch_compliance(
+    values: np.ndarray, mins: np.ndarray, maxs: np.ndarray
+) -> np.ndarray:
+    """Check every row of values against the per column limits."""
+
+    compliant = np.empty(values.shape[0], dtype=np.bool_)
+
+    for row in prange(values.shape[0]):  # pylint: disable=not-an-iterable
+        row_compliant = True
+        for col in range(values.shape[1]):
+            if not mins[col] <= values[row, col] <= maxs[col]:
+                row_compliant = False
+                break
+        compliant[row] = row_compliant
+
+    return compliant
@@ -0,0 +1,64 @@
+"""Module for the numeric kernels of the compost calculations."""
+
+import functools
+from typing import Callable
+
+import numpy as np
+
+from cqe.globs import MAX_SCORE
+
+
+def _batch_index_numpy(
+    values: np.ndarray, limits: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Calculate the weighted index of every row of values with NumPy."""
+
+    exceeded = values[:, :, np.newaxis] > limits
+    scores = MAX_SCORE - exceeded.sum(axis=2)
+
+    return scores @ weights / weights.sum()
+
+
+def _batch_compliance_numpy(
+    values: np.ndarray, mins: np.ndarray, maxs: np.ndarray
+) -> np.ndarray:
+    """Check every row of values against the per column limits with NumPy."""
+
+    return ((values >= mins) & (values <= maxs)).all(axis=1)
+
+
+@functools.lru_cache(maxsize=None)
+def _batch_kernels() -> tuple[Callable, Callable]:
+    """Return the batch index and compliance kernels.
+
+    The parallel Numba kernels are only needed for batch scoring, so numba is
+    imported, and the kernels compiled, on first use rather than with this
+    module. Without numba the NumPy versions are used.
+    """
+
+    try:
+        from cqe import _jit_kernels  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return _batch_index_numpy, _batch_compliance_numpy
+
+    return _jit_kernels.batch_index, _jit_kernels.batch_compliance
+
+
+def batch_index(
+    values: np.ndarray, limits: np.ndarray, weights: np.ndarray
+) -> np.ndarray:
+    """Calculate the weighted index of every row of values.
+
+    The limits are oriented so that a value scores one less for each of its
+    property's limits that it is greater than.
+    """
+
+    return _batch_kernels()[0](values, limits, weights)
+
+
+def batch_compliance(
+    values: np.ndarray, mins: np.ndarray, maxs: np.ndarray
+) -> np.ndarray:
+    """Check every row of values against the per column limits."""
+
+    return _batch_kernels()[1](values, mins, maxs)
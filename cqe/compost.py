@@ -1,14 +1,40 @@
 """Module for running the compost class."""
 
-from dataclasses import dataclass, field
+from collections import namedtuple
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+import functools
+import logging
+import operator
+import os
+import sys
 from typing import Callable
-import yaml
+import numpy as np
 
-from cqe.globs import IndexType
+from cqe import _kernels
+from cqe.globs import CategoryType, IndexType
 from cqe.index import Index
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+_BASIC_NAMES = ("moisture", "ph", "conductivity", "bulk_density")
+_NUTRITIONAL_NAMES = ("organic_matter", "nitrogen", "phosphorus", "potassium")
+_HEAVY_METAL_NAMES = (
+    "zinc",
+    "copper",
+    "cadmium",
+    "lead",
+    "chromium",
+    "nickel",
+    "arsenic",
+    "mercury",
+)
+_DERIVED_NAMES = ("cn_ratio", "npk")
+
+INPUT_NAMES = _BASIC_NAMES + _NUTRITIONAL_NAMES + _HEAVY_METAL_NAMES
+
+
+@dataclass(frozen=True, slots=True)
 class Limit:
     """Utility class for setting limits."""
 
@@ -22,12 +48,84 @@ class Limit:
             )
 
 
-@dataclass
+_DEFAULT_LIMIT = Limit()
+
+
+@functools.lru_cache(maxsize=None)
+def _limit(minimum: float, maximum: float) -> Limit:
+    """Return a shared limit object for the given bounds."""
+
+    return Limit(minimum, maximum)
+
+
+class FrozenConfig(Mapping):
+    """Read-only mapping of a parsed config.
+
+    Nested mappings are frozen as well and lists become tuples, so a config
+    shared through the read_yaml cache cannot be changed by its users.
+    """
+
+    def __init__(self, data: Mapping):
+
+        self._data = {key: _freeze(value) for key, value in data.items()}
+        self._property_configs = {}
+
+    def property_config(self, name: str) -> "PropertyConfig":
+        """Return the settings of a property, built on first use."""
+
+        cfg = self._property_configs.get(name)
+        if cfg is None:
+            cfg = _build_property_config(self._data[name])
+            self._property_configs[name] = cfg
+
+        return cfg
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def _freeze(value):
+    """Return a read-only copy of a parsed yaml value."""
+
+    if isinstance(value, Mapping):
+        return FrozenConfig(value)
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+PropertyConfig = namedtuple(
+    "PropertyConfig", ["compliance_limit", "weight", "category_limits"]
+)
+
+
+def _build_property_config(settings: Mapping) -> PropertyConfig:
+    """Build the settings of one property from its config entry."""
+
+    return PropertyConfig(
+        _limit(*settings["compliance_limit"]),
+        settings.get("weight"),
+        settings.get("category_limits"),
+    )
+
+
+@dataclass(slots=True)
 class Property:
     """Class for a property of the compost."""
 
     name: str
-    value: str
+    value: float
 
     theoretical_limit: Limit
     compliance_limit: Limit
@@ -39,13 +137,14 @@ class Property:
     def is_compliant(self) -> bool:
         """Check if the property is compliant with the limits."""
 
-        return self.compliance_limit.min <= self.value <= self.compliance_limit.max
+        limit = self.compliance_limit
+        return limit.min <= self.value <= limit.max
 
     def __repr__(self) -> str:
         return f"{self.name}: {self.value}, {self.is_compliant}"
 
 
-@dataclass
+@dataclass(slots=True)
 class NutritionalProperty(Property):
     """Class for a nutritional property of the compost."""
 
@@ -74,7 +173,7 @@ class NutritionalProperty(Property):
         return f"{self.name}: {self.value}, {self.is_compliant}, {self.fertilization_index.score}"
 
 
-@dataclass
+@dataclass(slots=True)
 class HeavyMetalProperty(Property):
     """Class for a heavy metal property of the compost."""
 
@@ -101,18 +200,34 @@ class HeavyMetalProperty(Property):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _props_getter(cls: type) -> Callable:
+    """Return a function reading the init fields of a container as a tuple."""
+
+    names = tuple(fld.name for fld in fields(cls) if fld.init)
+    getter = operator.attrgetter(*names)
+
+    if len(names) == 1:
+        return lambda props: (getter(props),)
+
+    return getter
+
+
 class Properties:
     """Base class for the properties of the compost."""
 
-    def show_all_properties(self) -> str:
-        """Show all the properties of the compost."""
+    __slots__ = ("_props",)
 
-        strings = []
+    _props: tuple[Property, ...]
+
+    def __post_init__(self):
 
-        for prop in self.__dict__.values():
-            strings.append(str(prop))
+        self._props = _props_getter(type(self))(self)
+
+    def show_all_properties(self) -> str:
+        """Show all the properties of the compost."""
 
-        return "\n".join(strings)
+        return "\n".join(map(str, self._props))
 
     def show_all_properties_with_header(self, header: str) -> str:
         """Show all the properties of the compost with a header."""
@@ -123,7 +238,7 @@ class Properties:
         return "\n" + "\n".join(strings)
 
 
-@dataclass
+@dataclass(slots=True)
 class CompostProperties(Properties):
     """Class for the properties of the compost."""
 
@@ -136,7 +251,7 @@ class CompostProperties(Properties):
         return self.show_all_properties_with_header("Compost Properties")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompostNutritionalProperties(Properties):
     """Class for the nutritional properties of the compost."""
 
@@ -145,23 +260,30 @@ class CompostNutritionalProperties(Properties):
     phosphorus: NutritionalProperty
     potassium: NutritionalProperty
 
+    _weight_sum: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+
+        Properties.__post_init__(self)
+
+        self._weight_sum = sum(prop.fertilization_index.weight for prop in self._props)
+
     @property
     def fertility_index(self) -> float:
         """Calculate the fertility index of the compost."""
 
         num = sum(
             prop.fertilization_index.weight * prop.fertilization_index.score
-            for prop in self.__dict__.values()
+            for prop in self._props
         )
-        den = sum(prop.fertilization_index.weight for prop in self.__dict__.values())
 
-        return num / den
+        return num / self._weight_sum
 
     def __repr__(self) -> str:
         return self.show_all_properties_with_header("Compost Nutritional Properties")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompostHeavyMetalProperties(Properties):
     """Class for the heavy metal properties of the compost."""
 
@@ -176,23 +298,29 @@ class CompostHeavyMetalProperties(Properties):
     arsenic: HeavyMetalProperty
     mercury: HeavyMetalProperty
 
+    _weight_sum: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+
+        Properties.__post_init__(self)
+
+        self._weight_sum = sum(prop.clean_index.weight for prop in self._props)
+
     @property
     def clean_index(self) -> float:
         """Calculate the clean index of the compost."""
 
         num = sum(
-            prop.clean_index.weight * prop.clean_index.score
-            for prop in self.__dict__.values()
+            prop.clean_index.weight * prop.clean_index.score for prop in self._props
         )
-        den = sum(prop.clean_index.weight for prop in self.__dict__.values())
 
-        return num / den
+        return num / self._weight_sum
 
     def __repr__(self) -> str:
         return self.show_all_properties_with_header("Compost Heavy Metal Properties")
 
 
-@dataclass
+@dataclass(slots=True)
 class CompostDerivedProperties(Properties):
     """Class for the derived properties of the compost."""
 
@@ -203,7 +331,7 @@ class CompostDerivedProperties(Properties):
         return self.show_all_properties_with_header("Compost Derived Properties")
 
 
-@dataclass
+@dataclass(slots=True)
 class Compost:
     """Class for the compost."""
 
@@ -212,47 +340,156 @@ class Compost:
     heavy_metal_properties: CompostHeavyMetalProperties
     derived_properties: CompostDerivedProperties
 
+    _all_props: tuple[Property, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+
+        # pylint: disable=protected-access
+
+        self._all_props = (
+            self.properties._props
+            + self.nutritional_properties._props
+            + self.heavy_metal_properties._props
+            + self.derived_properties._props
+        )
+
     @property
     def is_compliant(self) -> bool:
         """Check if the compost is compliant with all the limits."""
 
-        all_properties = (
-            *vars(self.properties).values(),
-            *vars(self.nutritional_properties).values(),
-            *vars(self.heavy_metal_properties).values(),
-            *vars(self.derived_properties).values(),
+        return all(prop.is_compliant for prop in self._all_props if prop.use_compliance)
+
+    @classmethod
+    def score_batch(
+        cls, configs: dict, inputs
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Score many composts at once without creating property objects.
+
+        The inputs are either a DataFrame with a column per input property or an
+        array of shape (N, len(INPUT_NAMES)) with the columns in INPUT_NAMES order.
+        Returns the compliance, fertility index and clean index of every row.
+
+        Unlike create_from_yaml, a row with zero nitrogen does not raise
+        ZeroDivisionError. Its cn ratio is infinite, or NaN when the organic
+        matter is zero as well, so the row is reported as not compliant.
+        """
+
+        if hasattr(inputs, "columns"):
+            inputs = inputs[list(INPUT_NAMES)].to_numpy()
+
+        values = np.asarray(inputs, dtype=np.float64)
+
+        if values.ndim != 2 or values.shape[1] != len(INPUT_NAMES):
+            raise ValueError(
+                f"Inputs must have shape (N, {len(INPUT_NAMES)}), got {values.shape}."
+            )
+
+        columns = dict(zip(INPUT_NAMES, values.T))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derived = np.column_stack(
+                [
+                    CompostFactory.cn_calculator(columns),
+                    CompostFactory.npk_calculator(columns),
+                ]
+            )
+
+        all_names = INPUT_NAMES + _DERIVED_NAMES
+        all_values = np.hstack([values, derived])
+        limits = np.array(
+            [configs[name]["compliance_limit"] for name in all_names], dtype=np.float64
+        )
+        compliant = _kernels.batch_compliance(all_values, limits[:, 0], limits[:, 1])
+
+        fertility_index = _batch_index(
+            configs, _NUTRITIONAL_NAMES, IndexType.FERTILITY, columns
+        )
+        clean_index = _batch_index(
+            configs, _HEAVY_METAL_NAMES, IndexType.CLEAN, columns
         )
 
-        return all(prop.is_compliant for prop in all_properties if prop.use_compliance)
+        return compliant, fertility_index, clean_index
 
 
 class CompostFactory:
     """Factory class for creating compost objects."""
 
     @staticmethod
-    def read_yaml(file_path: str) -> dict:
-        """Read a yaml file and return a dictionary."""
+    def read_yaml(file_path: str) -> FrozenConfig:
+        """Read a yaml file and return a read-only mapping.
+
+        The result is cached until the file is modified, so callers share the
+        same mapping. Every value is made read-only, so lists come back as
+        tuples and do not compare equal to the lists yaml.safe_load returns.
+        """
+
+        return CompostFactory._load_yaml(file_path, os.path.getmtime(file_path))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_yaml(file_path: str, mtime: float) -> FrozenConfig:
+        """Parse a yaml file, cached on its path and modification time."""
+
+        # pylint: disable=unused-argument,import-outside-toplevel
+
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
         with open(file_path, "r", encoding="utf_8") as file:
-            return yaml.safe_load(file)
+            data = yaml.load(file, Loader=loader)
+
+        if not isinstance(data, dict):
+            return _freeze(data)
+
+        # Interned keys let lookups by the literal property names match by identity.
+        return FrozenConfig(
+            {
+                sys.intern(key) if isinstance(key, str) else key: value
+                for key, value in data.items()
+            }
+        )
+
+    @staticmethod
+    @functools.cache
+    def load_baked_config() -> FrozenConfig | None:
+        """Return the configs baked by scripts/bake_config.py, if available.
+
+        The configs are frozen once and the same mapping is returned on every
+        call. The baked module is a snapshot: edits to configs.yml are not seen
+        here until the script is rerun, and only the test suite checks that the
+        two agree.
+        """
+
+        try:
+            from cqe import _config_data  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return None
+
+        return FrozenConfig(_config_data.CONFIG)
 
     @staticmethod
     def create_limit_from_config(config: dict, name: str) -> Limit:
         """Create a limit object from a yaml dictionary."""
 
-        return Limit(
-            config[name]["compliance_limit"][0],
-            config[name]["compliance_limit"][1],
-        )
+        if type(config) is FrozenConfig:  # pylint: disable=unidiomatic-typecheck
+            return config.property_config(name).compliance_limit
+
+        return _limit(*config[name]["compliance_limit"])
 
     @staticmethod
     def create_index(name: str, typ: IndexType, config: dict) -> Index:
         """Create an index object from a yaml dictionary."""
 
+        if type(config) is FrozenConfig:  # pylint: disable=unidiomatic-typecheck
+            cfg = config.property_config(name)
+            return Index(typ, cfg.weight, cfg.category_limits)
+
+        settings = config[name]
+
         return Index(
             typ=typ,
-            weight=config[name]["weight"],
-            category_limits=config[name]["category_limits"],
+            weight=settings["weight"],
+            category_limits=settings["category_limits"],
         )
 
     @staticmethod
@@ -262,7 +499,7 @@ class CompostFactory:
         value = inputs[name]
         compliance_limit = CompostFactory.create_limit_from_config(config, name)
 
-        return Property(name, value, Limit(), compliance_limit, True, True)
+        return Property(name, value, _DEFAULT_LIMIT, compliance_limit, True, True)
 
     @staticmethod
     def create_nutritional_property(
@@ -276,7 +513,7 @@ class CompostFactory:
         return NutritionalProperty(
             name,
             value,
-            Limit(),
+            _DEFAULT_LIMIT,
             compliance_limit,
             True,
             True,
@@ -295,7 +532,7 @@ class CompostFactory:
         return HeavyMetalProperty(
             name,
             value,
-            Limit(),
+            _DEFAULT_LIMIT,
             compliance_limit,
             True,
             True,
@@ -325,26 +562,17 @@ class CompostFactory:
     def function_mapper() -> dict[str, (Callable, Callable)]:
         """Map the derived property name to the function that calculates it."""
 
-        return {
-            "cn_ratio": (
-                CompostFactory.cn_calculator,
-                CompostFactory.create_nutritional_property,
-            ),
-            "npk": (
-                CompostFactory.npk_calculator,
-                CompostFactory.create_property,
-            ),
-        }
+        return _DERIVED_FUNCTION_MAP
 
     @staticmethod
     def create_derived_property(name: str, config: dict, inputs: dict) -> Property:
         """Create a derived property object from a yaml dictionary."""
 
-        if name not in CompostFactory.function_mapper():
+        pair = _DERIVED_FUNCTION_MAP.get(name)
+        if pair is None:
             raise ValueError(f"Derived property {name} not recognised.")
 
-        function_map = CompostFactory.function_mapper()
-        calculator, creator = function_map[name]
+        calculator, creator = pair
         value = calculator(inputs)
         return creator(name, config, {name: value})
 
@@ -352,54 +580,34 @@ class CompostFactory:
     def create_from_yaml(configs: dict, inputs: dict) -> Compost:
         """Create a compost object from a yaml dictionary."""
 
-        moisture = CompostFactory.create_property("moisture", configs, inputs)
-        ph = CompostFactory.create_property("ph", configs, inputs)
-        conductivity = CompostFactory.create_property("conductivity", configs, inputs)
-        bulk_density = CompostFactory.create_property("bulk_density", configs, inputs)
+        create_property = CompostFactory.create_property
+        create_nutritional_property = CompostFactory.create_nutritional_property
+        create_heavy_metal_property = CompostFactory.create_heavy_metal_property
+        create_derived_property = CompostFactory.create_derived_property
 
-        properties = CompostProperties(moisture, ph, conductivity, bulk_density)
-
-        organic_matter = CompostFactory.create_nutritional_property(
-            "organic_matter", configs, inputs
-        )
-        nitrogen = CompostFactory.create_nutritional_property(
-            "nitrogen", configs, inputs
-        )
-        phosphorus = CompostFactory.create_nutritional_property(
-            "phosphorus", configs, inputs
-        )
-        potassium = CompostFactory.create_nutritional_property(
-            "potassium", configs, inputs
+        properties = CompostProperties(
+            *(create_property(name, configs, inputs) for name in _BASIC_NAMES)
         )
-
         nutritional_properties = CompostNutritionalProperties(
-            organic_matter, nitrogen, phosphorus, potassium
-        )
-
-        zinc = CompostFactory.create_heavy_metal_property("zinc", configs, inputs)
-        copper = CompostFactory.create_heavy_metal_property("copper", configs, inputs)
-        cadmium = CompostFactory.create_heavy_metal_property("cadmium", configs, inputs)
-        lead = CompostFactory.create_heavy_metal_property("lead", configs, inputs)
-        chromium = CompostFactory.create_heavy_metal_property(
-            "chromium", configs, inputs
+            *(
+                create_nutritional_property(name, configs, inputs)
+                for name in _NUTRITIONAL_NAMES
+            )
         )
-        nickel = CompostFactory.create_heavy_metal_property("nickel", configs, inputs)
-        arsenic = CompostFactory.create_heavy_metal_property("arsenic", configs, inputs)
-        mercury = CompostFactory.create_heavy_metal_property("mercury", configs, inputs)
-
         heavy_metal_properties = CompostHeavyMetalProperties(
-            zinc, copper, cadmium, lead, chromium, nickel, arsenic, mercury
+            *(
+                create_heavy_metal_property(name, configs, inputs)
+                for name in _HEAVY_METAL_NAMES
+            )
+        )
+        derived_properties = CompostDerivedProperties(
+            *(create_derived_property(name, configs, inputs) for name in _DERIVED_NAMES)
         )
 
-        cn_ratio = CompostFactory.create_derived_property("cn_ratio", configs, inputs)
-        npk_ratio = CompostFactory.create_derived_property("npk", configs, inputs)
-
-        derived_properties = CompostDerivedProperties(cn_ratio, npk_ratio)
-
-        print(properties)
-        print(nutritional_properties)
-        print(heavy_metal_properties)
-        print(derived_properties)
+        logger.debug("%s", properties)
+        logger.debug("%s", nutritional_properties)
+        logger.debug("%s", heavy_metal_properties)
+        logger.debug("%s", derived_properties)
 
         return Compost(
             properties,
@@ -409,6 +617,40 @@ class CompostFactory:
         )
 
 
+_DERIVED_FUNCTION_MAP: dict[str, (Callable, Callable)] = {
+    "cn_ratio": (
+        CompostFactory.cn_calculator,
+        CompostFactory.create_nutritional_property,
+    ),
+    "npk": (
+        CompostFactory.npk_calculator,
+        CompostFactory.create_property,
+    ),
+}
+
+
+def _batch_index(
+    configs: dict, names: tuple[str, ...], typ: IndexType, columns: dict
+) -> np.ndarray:
+    """Calculate an index of the named properties for every row of the columns."""
+
+    values = np.column_stack([columns[name] for name in names])
+    indices = [CompostFactory.create_index(name, typ, configs) for name in names]
+
+    weights = np.array([index.weight for index in indices], dtype=np.float64)
+    limits = np.array([index.category_limits for index in indices], dtype=np.float64)
+
+    # Flip decreasing limits so that every category counts the limits exceeded.
+    signs = np.array(
+        [
+            1.0 if index.category_type == CategoryType.INCREASING else -1.0
+            for index in indices
+        ]
+    )
+
+    return _kernels.batch_index(values * signs, limits * signs[:, np.newaxis], weights)
+
+
 if __name__ == "__main__":
 
     con = {"moisture": {"compliance_limit": [15, 25]}}
@@ -419,11 +661,17 @@ if __name__ == "__main__":
 
     ##################################
 
-    con = CompostFactory.read_yaml("cqe/configs.yml")
+    con = CompostFactory.load_baked_config() or CompostFactory.read_yaml(
+        "cqe/configs.yml"
+    )
     inp = CompostFactory.read_yaml("cqe/inputs.yml")
 
     compost = CompostFactory.create_from_yaml(con, inp)
 
+    print(compost.properties)
+    print(compost.nutritional_properties)
+    print(compost.heavy_metal_properties)
+    print(compost.derived_properties)
     print(compost.nutritional_properties.fertility_index)
     print(compost.heavy_metal_properties.clean_index)
     print(compost.is_compliant)
@@ -1,11 +1,12 @@
 """Module for the index of the compost."""
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 
 from cqe.globs import CategoryType, IndexType, MAX_SCORE
 
 
-@dataclass
+@dataclass(slots=True)
 class Index:
     """Class for an index of the compost."""
 
@@ -14,13 +15,20 @@ class Index:
     category_limits: list[float]
     category_type: CategoryType = field(init=False)
     score: float = field(init=False)
+    _sorted: tuple[float, ...] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
 
-        if self.category_limits == sorted(self.category_limits):
+        # Compared as tuples, since frozen configs hold the limits as tuples.
+        limits = tuple(self.category_limits)
+        ascending = tuple(sorted(limits))
+
+        if limits == ascending:
             self.category_type = CategoryType.INCREASING
-        elif self.category_limits == sorted(self.category_limits, reverse=True):
+            self._sorted = ascending
+        elif limits == ascending[::-1]:
             self.category_type = CategoryType.DECREASING
+            self._sorted = ascending
         else:
             raise ValueError(
                 "Category limits must be in increasing or decreasing order."
@@ -28,13 +36,11 @@ class Index:
 
     def set_score(self, value: float):
         """Set the score of the index."""
-        self.score = MAX_SCORE
+
+        # The score drops by one for every limit the value is worse than.
         if self.category_type == CategoryType.INCREASING:
-            for limit in self.category_limits:
-                if value > limit:
-                    self.score -= 1
-
-        elif self.category_type == CategoryType.DECREASING:
-            for limit in self.category_limits:
-                if value < limit:
-                    self.score -= 1
+            exceeded = bisect_left(self._sorted, value)
+        else:
+            exceeded = len(self._sorted) - bisect_right(self._sorted, value)
+
+        self.score = MAX_SCORE - exceeded
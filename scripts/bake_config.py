@@ -0,0 +1,40 @@
+"""Script for baking the compost configs into a Python module.
+
+Running the script needs black as a development requirement, to format the
+generated module like the rest of the package. Importing the baked module
+does not need it.
+"""
+
+from pathlib import Path
+
+import black
+import yaml
+
+CQE_DIR = Path(__file__).resolve().parent.parent / "cqe"
+
+HEADER = '''"""Compost configs baked from configs.yml by scripts/bake_config.py.
+
+Do not edit by hand; rerun the script after changing configs.yml.
+"""
+
+'''
+
+
+def bake(source: Path, target: Path):
+    """Write the configs in the source yaml file as a CONFIG dict to the target.
+
+    The module is formatted with black so it matches the rest of the package.
+    """
+
+    with open(source, "r", encoding="utf_8") as file:
+        config = yaml.safe_load(file)
+
+    code = black.format_str(f"{HEADER}CONFIG = {config!r}\n", mode=black.Mode())
+
+    with open(target, "w", encoding="utf_8") as file:
+        file.write(code)
+
+
+if __name__ == "__main__":
+
+    bake(CQE_DIR / "configs.yml", CQE_DIR / "_config_data.py")
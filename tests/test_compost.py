@@ -0,0 +1,184 @@
+"""Testing the compost module."""
+
+from pathlib import Path
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+
+from cqe.compost import INPUT_NAMES, Compost, CompostFactory, FrozenConfig, Limit
+
+CQE_DIR = Path(__file__).resolve().parent.parent / "cqe"
+
+
+@pytest.fixture(name="configs")
+def fixture_configs():
+    """Load the default configs."""
+    return CompostFactory.read_yaml(str(CQE_DIR / "configs.yml"))
+
+
+@pytest.fixture(name="inputs")
+def fixture_inputs():
+    """Load the default inputs."""
+    return CompostFactory.read_yaml(str(CQE_DIR / "inputs.yml"))
+
+
+def test_baked_config_matches_yaml(configs):
+    """Test that the baked configs are up to date with configs.yml."""
+
+    assert CompostFactory.load_baked_config() == configs
+    assert CompostFactory.load_baked_config() is CompostFactory.load_baked_config()
+
+
+def test_read_yaml_is_read_only(configs):
+    """Test that the cached configs cannot be changed by callers."""
+
+    with pytest.raises(TypeError):
+        configs["moisture"] = {}
+
+    with pytest.raises(TypeError):
+        configs["moisture"]["compliance_limit"][0] = 0
+
+
+def test_read_yaml_pickles(configs):
+    """Test that the configs returned by read_yaml can be pickled."""
+
+    assert pickle.loads(pickle.dumps(configs)) == configs
+
+
+def test_read_yaml_non_mapping(tmp_path):
+    """Test that yaml files without a mapping are also returned read-only."""
+
+    empty = tmp_path / "empty.yml"
+    empty.write_text("", encoding="utf_8")
+    assert CompostFactory.read_yaml(str(empty)) is None
+
+    listing = tmp_path / "list.yml"
+    listing.write_text("- 1\n- 2\n", encoding="utf_8")
+    assert CompostFactory.read_yaml(str(listing)) == (1, 2)
+
+    with pytest.raises(AttributeError):
+        CompostFactory.read_yaml(str(listing)).append(3)
+
+
+def test_score_batch_matches_compost(configs, inputs):
+    """Test that batch scoring agrees with scoring one compost at a time."""
+
+    rows = [dict(inputs), dict(inputs, nitrogen=0.4, mercury=2.0, zinc=800)]
+    compliant, fertility_index, clean_index = Compost.score_batch(
+        configs, np.array([[row[name] for name in INPUT_NAMES] for row in rows])
+    )
+
+    for i, row in enumerate(rows):
+        compost = CompostFactory.create_from_yaml(configs, row)
+        assert compliant[i] == compost.is_compliant
+        assert fertility_index[i] == pytest.approx(
+            compost.nutritional_properties.fertility_index
+        )
+        assert clean_index[i] == pytest.approx(
+            compost.heavy_metal_properties.clean_index
+        )
+
+
+def test_score_batch_dataframe(configs, inputs):
+    """Test that batch scoring picks the input columns of a DataFrame by name."""
+
+    pd = pytest.importorskip("pandas")
+
+    rows = [dict(inputs), dict(inputs, nitrogen=0.4, mercury=2.0, zinc=800)]
+    frame = pd.DataFrame(rows)[list(reversed(INPUT_NAMES))].assign(notes="x")
+    array = np.array([[row[name] for name in INPUT_NAMES] for row in rows])
+
+    for expected, result in zip(
+        Compost.score_batch(configs, array), Compost.score_batch(configs, frame)
+    ):
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_score_batch_zero_nitrogen(configs, inputs):
+    """Test that batch scoring flags zero nitrogen instead of raising."""
+
+    with pytest.raises(ZeroDivisionError):
+        CompostFactory.create_from_yaml(configs, dict(inputs, nitrogen=0))
+
+    rows = [dict(inputs, nitrogen=0), dict(inputs, nitrogen=0, organic_matter=0)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        compliant, fertility_index, clean_index = Compost.score_batch(
+            configs, np.array([[row[name] for name in INPUT_NAMES] for row in rows])
+        )
+
+    assert not compliant.any()
+    assert np.isfinite(fertility_index).all()
+    assert np.isfinite(clean_index).all()
+
+
+def test_score_batch_shape(configs):
+    """Test that batch scoring rejects inputs with the wrong number of columns."""
+
+    with pytest.raises(ValueError):
+        Compost.score_batch(configs, np.ones((2, len(INPUT_NAMES) - 1)))
+
+
+def test_rescored_property_updates_index(configs, inputs):
+    """Test that re-scoring one property is reflected in the indices."""
+
+    compost = CompostFactory.create_from_yaml(configs, inputs)
+    nutritional = compost.nutritional_properties
+    heavy_metal = compost.heavy_metal_properties
+
+    nutritional.nitrogen.value = 0.1
+    nutritional.nitrogen.set_score()
+    assert nutritional.nitrogen.fertilization_index.score == 1.0
+    assert nutritional.fertility_index == pytest.approx(35 / 12)
+
+    heavy_metal.zinc.value = 1000
+    heavy_metal.zinc.set_score()
+    assert heavy_metal.clean_index == pytest.approx(95 / 24)
+
+
+def test_plain_config_edits_are_used():
+    """Test that editing a plain config dict in place takes effect."""
+
+    config = {"moisture": {"compliance_limit": [15, 25]}}
+    inputs = {"moisture": 20}
+
+    assert CompostFactory.create_property("moisture", config, inputs).is_compliant
+
+    config["moisture"]["compliance_limit"] = [0, 1]
+    prop = CompostFactory.create_property("moisture", config, inputs)
+
+    assert prop.compliance_limit == Limit(0, 1)
+    assert not prop.is_compliant
+
+
+def test_config_with_extra_entries():
+    """Test that entries other than properties do not break the factory."""
+
+    config = {"notes": {"author": "me"}, "moisture": {"compliance_limit": [15, 25]}}
+
+    for cfg in (config, FrozenConfig(config)):
+        prop = CompostFactory.create_property("moisture", cfg, {"moisture": 20})
+        assert prop.compliance_limit == Limit(15, 25)
+
+
+def test_compliance_limit_change_is_used():
+    """Test that replacing a property's compliance limit takes effect."""
+
+    config = {"moisture": {"compliance_limit": [15, 25]}}
+    prop = CompostFactory.create_property("moisture", config, {"moisture": 20})
+    assert prop.is_compliant
+
+    prop.compliance_limit = Limit(0, 1)
+    assert not prop.is_compliant
+
+
+def test_use_compliance_change_is_used(configs, inputs):
+    """Test that turning off a property's compliance check takes effect."""
+
+    compost = CompostFactory.create_from_yaml(configs, dict(inputs, moisture=30))
+    assert not compost.is_compliant
+
+    compost.properties.moisture.use_compliance = False
+    assert compost.is_compliant
@@ -50,3 +50,26 @@ def test_set_score_increasing():
 
     index.set_score(0.35)
     assert index.score == 2.0
+
+
+def test_set_score_decreasing():
+    """Test the set_score method with decreasing limits."""
+    index = Index(
+        typ="fertility",
+        weight=0.5,
+        category_limits=[0.3, 0.2, 0.1],
+    )
+    index.set_score(0.35)
+    assert index.score == 5.0
+
+    index.set_score(0.3)
+    assert index.score == 5.0
+
+    index.set_score(0.25)
+    assert index.score == 4.0
+
+    index.set_score(0.15)
+    assert index.score == 3.0
+
+    index.set_score(0.05)
+    assert index.score == 2.0
@@ -0,0 +1,64 @@
+"""Testing the kernels modules."""
+
+import numpy as np
+import pytest
+
+from cqe import _kernels
+
+
+@pytest.fixture(name="jit_kernels")
+def fixture_jit_kernels():
+    """Import the Numba kernels, skipping when numba is not installed."""
+
+    pytest.importorskip("numba")
+
+    from cqe import _jit_kernels  # pylint: disable=import-outside-toplevel
+
+    return _jit_kernels
+
+
+def test_batch_index_matches_numpy(jit_kernels):
+    """Test that the Numba index kernel agrees with the NumPy version."""
+
+    # The second column holds decreasing limits, sign flipped as in score_batch.
+    limits = np.array([[1.0, 2.0, 3.0], [-3.0, -2.0, -1.0]])
+    weights = np.array([2.0, 1.0])
+    values = np.array(
+        [
+            [0.5, -3.5],
+            [2.0, -2.0],
+            [2.5, -1.5],
+            [-10.0, 10.0],
+            [10.0, -10.0],
+        ]
+    )
+
+    np.testing.assert_allclose(
+        jit_kernels.batch_index(values, limits, weights),
+        _kernels._batch_index_numpy(  # pylint: disable=protected-access
+            values, limits, weights
+        ),
+    )
+
+
+def test_batch_compliance_matches_numpy(jit_kernels):
+    """Test that the Numba compliance kernel agrees with the NumPy version."""
+
+    mins = np.array([0.0, 10.0])
+    maxs = np.array([1.0, 20.0])
+    values = np.array(
+        [
+            [0.5, 15.0],
+            [0.0, 20.0],
+            [-0.1, 15.0],
+            [0.5, 20.1],
+            [2.0, 5.0],
+        ]
+    )
+
+    np.testing.assert_array_equal(
+        jit_kernels.batch_compliance(values, mins, maxs),
+        _kernels._batch_compliance_numpy(  # pylint: disable=protected-access
+            values, mins, maxs
+        ),
+    )